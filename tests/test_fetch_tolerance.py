@@ -0,0 +1,80 @@
+import asyncio
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "1:test")
+
+from winter_wellness_bot import main as bot_main
+from winter_wellness_bot.utils import infer_sessions
+
+T0 = datetime(2024, 1, 1, 10, 0)
+# 15 valid hot minutes plus rows the sensor should never produce
+GOOD = [(T0 + timedelta(minutes=i), 60.0) for i in range(15)]
+BAD = [
+    (T0 + timedelta(minutes=20), None),
+    (T0 + timedelta(minutes=21), float("nan")),
+    (T0 + timedelta(minutes=22), 1e9),
+    (T0 + timedelta(minutes=23), -1e9),
+]
+WINDOW = (T0 - timedelta(hours=1), T0 + timedelta(hours=1))
+
+
+def assert_expected_session(samples):
+    ts, temps = samples
+    assert len(ts) == len(GOOD)
+    sessions = infer_sessions(samples, threshold_c=45.0, min_duration_min=10, gap_minutes=8)
+    assert len(sessions) == 1
+    assert sessions[0]["start"] == T0
+    assert sessions[0]["max_c"] == 60.0
+
+
+def make_db(path, ddl, rows):
+    conn = sqlite3.connect(path)
+    conn.execute(ddl)
+    conn.executemany("INSERT INTO temperatures VALUES (?,?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def test_sqlite_epoch_fetch_skips_bad_rows(tmp_path):
+    path = str(tmp_path / "epoch.db")
+    make_db(path, "CREATE TABLE temperatures (ts INTEGER, temperature REAL)",
+            [(int(t.timestamp()), temp) for t, temp in GOOD + BAD])
+    assert_expected_session(bot_main.fetch_sauna_history_from_sqlite(path, *WINDOW))
+
+
+def test_sqlite_iso_fetch_skips_bad_rows(tmp_path):
+    path = str(tmp_path / "iso.db")
+    make_db(path, "CREATE TABLE temperatures (timestamp TEXT, celsius REAL)",
+            [(t.isoformat(), temp) for t, temp in GOOD + BAD])
+    assert_expected_session(bot_main.fetch_sauna_history_from_sqlite(path, *WINDOW))
+
+
+def test_http_fetch_skips_bad_rows(monkeypatch):
+    class FakeResp:
+        def raise_for_status(self):
+            pass
+
+        async def json(self):
+            return [{"timestamp": t.isoformat(), "celsius": temp} for t, temp in GOOD + BAD]
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeSession:
+        def get(self, url, params=None):
+            return FakeResp()
+
+    monkeypatch.setattr(bot_main, "_http_session", FakeSession())
+    samples = asyncio.run(bot_main.fetch_sauna_history_from_http("http://sauna", *WINDOW))
+    assert_expected_session(samples)
+
+
+def test_tuple_input_tolerates_bad_rows():
+    # The legacy tuple path clamps instead of skipping, but must not raise.
+    sessions = infer_sessions(GOOD + BAD[1:], threshold_c=45.0, min_duration_min=10, gap_minutes=8)
+    assert sessions and sessions[0]["start"] == T0
@@ -34,6 +34,18 @@ def test_gap_breaks_session():
     assert sessions[0]["max_c"] == 52.0
 
 
+def test_soa_input_matches_tuple_input():
+    import numpy as np
+
+    t0 = datetime(2024, 1, 1, 10, 0)
+    samples = make_series(t0, 15, 60.0)
+    ts = np.array([t.timestamp() for t, _ in samples], dtype=np.float64)
+    temps = np.array([temp for _, temp in samples], dtype=np.float32)
+    sessions = infer_sessions((ts, temps), threshold_c=45.0, min_duration_min=10, gap_minutes=8)
+    assert sessions == infer_sessions(samples, threshold_c=45.0, min_duration_min=10, gap_minutes=8)
+    assert sessions[0]["start"] == t0
+
+
 def test_human_duration_formatting():
     assert human_duration(5) == "5ד׳"
     assert human_duration(60) == "1ש׳"
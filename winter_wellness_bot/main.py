@@ -8,7 +8,9 @@ Winter Wellness Telegram Bot (Raspberry Pi)
 - Simple mood check-in
 """
 
+import io
 import os
+import re
 import sys
 import time
 import json
@@ -19,7 +21,8 @@ import logging
 import sqlite3
 from datetime import datetime, timedelta, timezone
 
-import requests
+import aiohttp
+import numpy as np
 from aiogram import Bot, Dispatcher, types
 from aiogram.enums import ParseMode
 from aiogram.filters import Command
@@ -103,23 +106,43 @@ try:
 except Exception:
     from utils import human_duration, infer_sessions  # script-style fallback
 
-def fetch_open_meteo(lat: float, lon: float):
+# One ClientSession for all outbound HTTP; created in main() before polling
+# starts so the dispatcher never blocks on connection setup.
+_http_session: aiohttp.ClientSession | None = None
+
+# Short-lived forecast cache: the daily max/min changes a few times a day,
+# so repeated /now calls within the TTL reuse one HTTP round-trip.
+_WX_TTL_S = 600
+_wx_cache: dict = {}  # (lat, lon) -> (expires_at_monotonic, payload)
+_wx_lock = asyncio.Lock()
+
+async def fetch_open_meteo(lat: float, lon: float):
     # Today + tonight simple forecast
     # https://api.open-meteo.com/v1/forecast?latitude=32.0853&longitude=34.7818&hourly=temperature_2m,relative_humidity_2m,precipitation,weather_code&daily=temperature_2m_max,temperature_2m_min&timezone=auto
+    cached = _wx_cache.get((lat, lon))
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
     url = "https://api.open-meteo.com/v1/forecast"
     params = {
-        "latitude": lat, "longitude": lon,
+        "latitude": str(lat), "longitude": str(lon),
         "hourly": "temperature_2m,precipitation,weather_code",
         "daily": "temperature_2m_max,temperature_2m_min",
         "timezone": TIMEZONE,
     }
-    try:
-        r = requests.get(url, params=params, timeout=10)
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        log.warning(f"Open-Meteo error: {e}")
-        return None
+    async with _wx_lock:
+        # Re-check: another /now may have refreshed while we waited.
+        cached = _wx_cache.get((lat, lon))
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+        try:
+            async with _http_session.get(url, params=params) as r:
+                r.raise_for_status()
+                data = await r.json()
+        except Exception as e:
+            log.warning(f"Open-Meteo error: {e}")
+            return None
+        _wx_cache[(lat, lon)] = (time.monotonic() + _WX_TTL_S, data)
+        return data
 
 def summarize_weather(data: dict) -> str:
     if not data:
@@ -132,61 +155,176 @@ def summarize_weather(data: dict) -> str:
     except Exception:
         return "⛅️ תחזית לא זמינה כרגע."
 
+# One read-only connection per DB path, reused across calls so we pay
+# for open/parse/PRAGMA setup once instead of on every fetch. Handlers
+# reach SQLite via asyncio.to_thread, hence check_same_thread=False.
+_conn_cache: dict = {}
+
+def _get_sauna_conn(path: str) -> sqlite3.Connection:
+    conn = _conn_cache.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.executescript(
+            "PRAGMA query_only=1;"
+            "PRAGMA mmap_size=268435456;"
+            "PRAGMA cache_size=-65536;"
+            "PRAGMA temp_store=MEMORY;"
+        )
+        _conn_cache[path] = conn
+    return conn
+
+# Detected temperatures schema per DB path: "epoch" (ts, temperature)
+# or "iso" (timestamp, celsius), probed via PRAGMA table_info instead
+# of running a failing SELECT every call. Only positive detections are
+# cached: the sensor logger may not have created the table yet, so a
+# miss re-probes (one cheap statement) until the schema appears.
+_schema_cache: dict = {}
+
+def _sauna_schema(path: str, conn: sqlite3.Connection):
+    schema = _schema_cache.get(path)
+    if schema is None:
+        cols = {r[1] for r in conn.execute("PRAGMA table_info(temperatures)")}
+        if {"ts", "temperature"} <= cols:
+            schema = "epoch"
+        elif {"timestamp", "celsius"} <= cols:
+            schema = "iso"
+        else:
+            log.warning("SQLite DB %s has no recognized temperatures schema", path)
+            return None
+        _schema_cache[path] = schema
+    return schema
+
 def fetch_sauna_history_from_sqlite(path: str, start_ts: datetime, end_ts: datetime):
     # Expect a table with at least: timestamp (ISO or unix), temperature (C)
-    rows = []
-    if not os.path.exists(path):
-        return rows
+    # Returns SoA arrays (epoch seconds, tenths of a degree) sorted by time;
+    # no per-row datetime objects are built for the hot loop.
+    if not path or not os.path.exists(path):
+        return []
     try:
-        conn = sqlite3.connect(path)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        # Try common schemas: timestamps either epoch seconds in 'ts' or ISO string in 'timestamp'
-        # We'll attempt both.
-        # 1) epoch seconds in 'ts' column
-        try:
-            cur.execute("SELECT ts, temperature FROM temperatures WHERE ts BETWEEN ? AND ? ORDER BY ts ASC",
-                        (int(start_ts.timestamp()), int(end_ts.timestamp())))
-            rows = [(datetime.fromtimestamp(r["ts"]), float(r["temperature"])) for r in cur.fetchall()]
-            if rows:
-                return rows
-        except Exception:
-            pass
-        # 2) ISO string in 'timestamp' column
-        try:
-            cur.execute("SELECT timestamp, celsius FROM temperatures WHERE timestamp BETWEEN ? AND ? ORDER BY timestamp ASC",
-                        (start_ts.isoformat(), end_ts.isoformat()))
-            rows = [(datetime.fromisoformat(r["timestamp"]), float(r["celsius"])) for r in cur.fetchall()]
-            return rows
-        except Exception:
+        conn = _get_sauna_conn(path)
+        schema = _sauna_schema(path, conn)
+        if schema == "epoch":
+            got = conn.execute("SELECT ts, temperature FROM temperatures WHERE ts BETWEEN ? AND ? ORDER BY ts ASC",
+                               (int(start_ts.timestamp()), int(end_ts.timestamp()))).fetchall()
+            if not got:
+                return []
+            ts_arr = np.fromiter((r[0] for r in got), dtype=np.float64, count=len(got))
+        elif schema == "iso":
+            got = conn.execute("SELECT timestamp, celsius FROM temperatures WHERE timestamp BETWEEN ? AND ? ORDER BY timestamp ASC",
+                               (start_ts.isoformat(), end_ts.isoformat())).fetchall()
+            if not got:
+                return []
+            ts_arr = np.fromiter((datetime.fromisoformat(r[0]).timestamp() for r in got),
+                                 dtype=np.float64, count=len(got))
+        else:
             return []
+        # Drop bad sensor rows (NULL/NaN/inf or beyond int16 tenths) like
+        # the HTTP fetcher does, instead of aborting the whole fetch.
+        temps = np.fromiter((r[1] if r[1] is not None else np.nan for r in got),
+                            dtype=np.float64, count=len(got))
+        tenths = np.round(temps * 10.0)
+        keep = np.isfinite(tenths) & (tenths >= -32768) & (tenths <= 32767)
+        if not keep.all():
+            ts_arr = ts_arr[keep]
+            tenths = tenths[keep]
+            if not len(ts_arr):
+                return []
+        return ts_arr, tenths.astype(np.int16)
     except Exception as e:
         log.warning(f"SQLite read error: {e}")
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
-def fetch_sauna_history_from_http(base_url: str, start_ts: datetime, end_ts: datetime):
+# Gaps-and-islands over the epoch schema: a new segment starts at a
+# below-threshold row arriving more than gap_s after the previous row;
+# within a segment the session spans the first to last hot row. Mirrors
+# infer_sessions, but only aggregated sessions cross into Python.
+# Temperatures are compared as tenths of a degree like the Python path,
+# so both agree at the rounding boundary; max comes back in tenths.
+_SQL_SESSIONS_EPOCH = """
+WITH tenths AS (
+    SELECT ts, CAST(ROUND(temperature * 10) AS INTEGER) AS temp_t
+    FROM temperatures
+    WHERE ts BETWEEN :start AND :end
+),
+marked AS (
+    SELECT ts, temp_t,
+           CASE WHEN temp_t < :thr_t
+                 AND ts - LAG(ts) OVER (ORDER BY ts) > :gap_s
+                THEN 1 ELSE 0 END AS brk
+    FROM tenths
+),
+segmented AS (
+    SELECT ts, temp_t, SUM(brk) OVER (ORDER BY ts) AS seg
+    FROM marked
+)
+SELECT MIN(ts), MAX(ts), MAX(temp_t)
+FROM segmented
+WHERE temp_t >= :thr_t
+GROUP BY seg
+HAVING MAX(ts) - MIN(ts) >= :min_dur_s
+ORDER BY MIN(ts)
+"""
+
+def fetch_sauna_sessions_from_sqlite(path: str, start_ts: datetime, end_ts: datetime,
+                                     threshold_c: float = 45.0,
+                                     min_duration_min: int = 10,
+                                     gap_minutes: int = 8):
+    # Infer sessions directly in SQL instead of pulling every sample row.
+    # Returns session dicts like infer_sessions, or None when the epoch
+    # schema has no data for the window (caller falls back to samples).
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        conn = _get_sauna_conn(path)
+        if _sauna_schema(path, conn) != "epoch":
+            return None
+        params = {
+            "start": int(start_ts.timestamp()), "end": int(end_ts.timestamp()),
+            "thr_t": int(round(threshold_c * 10)),
+            "gap_s": gap_minutes * 60, "min_dur_s": min_duration_min * 60,
+        }
+        rows = conn.execute(_SQL_SESSIONS_EPOCH, params).fetchall()
+        if not rows:
+            # Distinguish "samples but no sessions" from "no samples at all"
+            # so the HTTP fallback still kicks in for an empty window.
+            has_data = conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM temperatures WHERE ts BETWEEN :start AND :end)",
+                params).fetchone()[0]
+            return [] if has_data else None
+        return [
+            {
+                "start": datetime.fromtimestamp(s),
+                "end": datetime.fromtimestamp(e),
+                "max_c": float(max_t) / 10.0,
+                "minutes": int((e - s) / 60.0),
+            }
+            for s, e, max_t in rows
+        ]
+    except Exception as e:
+        log.warning(f"SQLite session query error: {e}")
+        return None
+
+async def fetch_sauna_history_from_http(base_url: str, start_ts: datetime, end_ts: datetime):
     # Expect server exposing /history?from=ISO&to=ISO -> list of {timestamp, celsius}
+    # Returns SoA arrays (epoch seconds, tenths of a degree) sorted by time.
     url = f"{base_url}/history"
     params = {"from": start_ts.isoformat(), "to": end_ts.isoformat()}
     attempts = 3
     backoff = 2
     for i in range(attempts):
         try:
-            r = requests.get(url, params=params, timeout=10)
-            r.raise_for_status()
-            data = r.json()
+            async with _http_session.get(url, params=params) as r:
+                r.raise_for_status()
+                data = await r.json()
             if not isinstance(data, list):
                 log.warning("HTTP history: unexpected payload (not a list)")
                 return []
-            rows = []
             limit = 10000
-            for idx, item in enumerate(data):
-                if idx >= limit:
+            ts_arr = np.empty(limit, np.float64)
+            temp_arr = np.empty(limit, np.int16)  # tenths of a degree
+            n = 0
+            for item in data:
+                if n >= limit:
                     log.warning("HTTP history truncated at %d items", limit)
                     break
                 if not isinstance(item, dict):
@@ -196,27 +334,35 @@ def fetch_sauna_history_from_http(base_url: str, start_ts: datetime, end_ts: dat
                 if ts is None or temp is None:
                     continue
                 try:
-                    t = datetime.fromisoformat(str(ts))
+                    t = datetime.fromisoformat(str(ts)).timestamp()
                 except Exception:
                     try:
-                        t = datetime.fromtimestamp(float(ts))
+                        t = float(ts)
                     except Exception:
                         continue
                 try:
                     tempf = float(temp)
                 except Exception:
                     continue
-                rows.append((t, tempf))
-            rows.sort(key=lambda x: x[0])
-            return rows
+                # Skip bad sensor rows (NaN/inf or beyond int16 tenths)
+                # like the other malformed-field cases above.
+                if not math.isfinite(tempf):
+                    continue
+                tenths = round(tempf * 10)
+                if not -32768 <= tenths <= 32767:
+                    continue
+                ts_arr[n] = t
+                temp_arr[n] = tenths
+                n += 1
+            ts_arr = ts_arr[:n]
+            temp_arr = temp_arr[:n]
+            order = np.argsort(ts_arr)
+            return ts_arr[order], temp_arr[order]
         except Exception as e:
             if i < attempts - 1:
                 sleep_s = backoff ** i
                 log.warning(f"HTTP history error (attempt {i+1}/{attempts}): {e}, retrying in {sleep_s}s")
-                try:
-                    time.sleep(sleep_s)
-                except Exception:
-                    pass
+                await asyncio.sleep(sleep_s)
             else:
                 log.warning(f"HTTP history error: {e}")
     return []
@@ -224,32 +370,40 @@ def fetch_sauna_history_from_http(base_url: str, start_ts: datetime, end_ts: dat
  # infer_sessions provided by utils
 
 async def build_daily_message(prefix_emoji: str) -> str:
-    # Weather
-    wx = fetch_open_meteo(LAT, LON)
-    wx_summary = summarize_weather(wx)
-
-    # Sauna sessions in last 24h
-    now = local_now()
-    start = now - timedelta(hours=24)
-    samples = []
-    if SAUNA_SQLITE_PATH:
-        log.debug("Fetching sauna history from SQLite")
-        samples = fetch_sauna_history_from_sqlite(SAUNA_SQLITE_PATH, start, now)
-    if not samples and SAUNA_BASE_URL:
-        log.debug("Fetching sauna history from HTTP base URL")
-        samples = fetch_sauna_history_from_http(SAUNA_BASE_URL, start, now)
-
-    sessions = infer_sessions(
-        samples,
-        threshold_c=SAUNA_TEMP_THRESHOLD_C,
-        min_duration_min=SAUNA_MIN_DURATION_MIN,
-    )
+    # Weather fetch overlaps the sauna history I/O below
+    wx_task = asyncio.create_task(fetch_open_meteo(LAT, LON))
+
+    # Sauna sessions in last 24h; skipped entirely when no source is set
+    sessions = []
+    if SAUNA_SQLITE_PATH or SAUNA_BASE_URL:
+        now = local_now()
+        start = now - timedelta(hours=24)
+        sessions = None
+        samples = []
+        if SAUNA_SQLITE_PATH:
+            log.debug("Fetching sauna sessions from SQLite")
+            sessions = await asyncio.to_thread(
+                fetch_sauna_sessions_from_sqlite, SAUNA_SQLITE_PATH, start, now,
+                SAUNA_TEMP_THRESHOLD_C, SAUNA_MIN_DURATION_MIN)
+            if sessions is None:
+                samples = await asyncio.to_thread(fetch_sauna_history_from_sqlite, SAUNA_SQLITE_PATH, start, now)
+        if sessions is None and not samples and SAUNA_BASE_URL:
+            log.debug("Fetching sauna history from HTTP base URL")
+            samples = await fetch_sauna_history_from_http(SAUNA_BASE_URL, start, now)
+        if sessions is None:
+            sessions = infer_sessions(
+                samples,
+                threshold_c=SAUNA_TEMP_THRESHOLD_C,
+                min_duration_min=SAUNA_MIN_DURATION_MIN,
+            )
+
+    wx_summary = summarize_weather(await wx_task)
 
     sauna_part = "🧖‍♂️ אין סשן סאונה ב‑24 השעות האחרונות."
     if sessions:
         last = sessions[-1]
         sauna_part = (
-            f"🧖‍♂️ סשן אחרון: {last['start'].strftime('%d.%m %H:%M')} · "
+            f"🧖‍♂️ סשן אחרון: {last['start']:%d.%m %H:%M} · "
             f"{human_duration(last['minutes'])} · מקס׳ {round(last['max_c'])}°C"
         )
 
@@ -317,22 +471,30 @@ async def cmd_now(message: types.Message):
 async def cmd_sauna(message: types.Message):
     now = local_now()
     start = now - timedelta(hours=48)
+    sessions = None
     samples = []
     if SAUNA_SQLITE_PATH:
-        samples = fetch_sauna_history_from_sqlite(SAUNA_SQLITE_PATH, start, now)
-    if not samples and SAUNA_BASE_URL:
-        samples = fetch_sauna_history_from_http(SAUNA_BASE_URL, start, now)
+        sessions = await asyncio.to_thread(
+            fetch_sauna_sessions_from_sqlite, SAUNA_SQLITE_PATH, start, now,
+            SAUNA_TEMP_THRESHOLD_C, SAUNA_MIN_DURATION_MIN)
+        if sessions is None:
+            samples = await asyncio.to_thread(fetch_sauna_history_from_sqlite, SAUNA_SQLITE_PATH, start, now)
+    if sessions is None and not samples and SAUNA_BASE_URL:
+        samples = await fetch_sauna_history_from_http(SAUNA_BASE_URL, start, now)
 
-    sessions = infer_sessions(samples, threshold_c=SAUNA_TEMP_THRESHOLD_C, min_duration_min=SAUNA_MIN_DURATION_MIN)
+    if sessions is None:
+        sessions = infer_sessions(samples, threshold_c=SAUNA_TEMP_THRESHOLD_C, min_duration_min=SAUNA_MIN_DURATION_MIN)
 
     if not sessions:
         await message.answer("🧖‍♂️ לא נמצאו סשנים ב‑48 השעות האחרונות.", disable_web_page_preview=True)
         return
 
-    lines = []
+    # Stream straight into one buffer instead of a lines list + join pass
+    buf = io.StringIO()
+    buf.write("🧖‍♂️ סשני סאונה אחרונים:")
     for s in sessions[-5:]:
-        lines.append(f"{s['start'].strftime('%d.%m %H:%M')} · {human_duration(s['minutes'])} · מקס׳ {round(s['max_c'])}°C")
-    await message.answer("🧖‍♂️ סשני סאונה אחרונים:\n" + "\n".join(lines))
+        buf.write(f"\n{s['start']:%d.%m %H:%M} · {human_duration(s['minutes'])} · מקס׳ {round(s['max_c'])}°C")
+    await message.answer(buf.getvalue())
 
 @dp.message(Command("mood"))
 async def cmd_mood(message: types.Message):
@@ -344,37 +506,70 @@ async def cmd_mood(message: types.Message):
     )
     await message.answer("איך המצב עכשיו? (1 נמוך · 5 גבוה)", reply_markup=kb)
 
-@dp.message()
-async def handle_mood_buttons(message: types.Message):
-    if message.text and message.text.startswith("Mood "):
-        try:
-            score = int(message.text.split()[1][0])
-        except Exception:
-            score = None
-        if score is None or score < 1 or score > 5:
-            await message.answer("נא לבחור מ‑1 עד 5.")
-            return
-        # Append to local CSV for simplicity
-        log_dir = os.getenv("DATA_DIR", ".")
-        os.makedirs(log_dir, exist_ok=True)
-        path = os.path.join(log_dir, "mood_log.csv")
-        # Rotate file if exceeds configured size
-        try:
-            max_bytes = int(os.getenv("MOOD_LOG_MAX_BYTES", "0"))
-        except Exception:
-            max_bytes = 0
-        if max_bytes > 0 and os.path.exists(path):
+# Mood log: one long-lived line-buffered append handle instead of an
+# open/write/close cycle per check-in; the size/rotation check is
+# amortized to every _MOOD_CHECK_EVERY writes or once a minute.
+_MOOD_CHECK_EVERY = 64
+_mood_fh = None
+_mood_path = None
+_mood_writes_since_check = 0
+_mood_last_check = 0.0
+
+def _append_mood_line(path: str, line: str, max_bytes: int) -> None:
+    global _mood_fh, _mood_path, _mood_writes_since_check, _mood_last_check
+    if _mood_fh is None or _mood_path != path:
+        if _mood_fh is not None:
+            try:
+                _mood_fh.close()
+            except Exception:
+                pass
+        _mood_fh = open(path, "a", encoding="utf-8", buffering=1)
+        _mood_path = path
+        _mood_writes_since_check = 0
+        _mood_last_check = time.monotonic()
+    if max_bytes > 0:
+        _mood_writes_since_check += 1
+        now_mono = time.monotonic()
+        if _mood_writes_since_check >= _MOOD_CHECK_EVERY or now_mono - _mood_last_check >= 60.0:
+            _mood_writes_since_check = 0
+            _mood_last_check = now_mono
             try:
-                if os.path.getsize(path) >= max_bytes:
+                if os.fstat(_mood_fh.fileno()).st_size >= max_bytes:
+                    _mood_fh.close()
                     ts = datetime.now().strftime("%Y%m%d%H%M%S")
-                    new_name = os.path.join(log_dir, f"mood_log-{ts}.csv")
+                    new_name = os.path.join(os.path.dirname(path), f"mood_log-{ts}.csv")
                     os.replace(path, new_name)
                     log.info("Rotated mood log to %s", new_name)
+                    _mood_fh = open(path, "a", encoding="utf-8", buffering=1)
             except Exception as e:
                 log.warning(f"Failed to rotate mood log: {e}")
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(f"{datetime.now().isoformat()},{score}\n")
-        await message.answer(f"תודה! נשמר דירוג מצב רוח: {score}")
+                if _mood_fh.closed:
+                    _mood_fh = open(path, "a", encoding="utf-8", buffering=1)
+    _mood_fh.write(line)
+
+# Precompiled: this handler runs for every message the bot sees, so the
+# common miss costs one regex match instead of split() allocations.
+_MOOD_RE = re.compile(r"^Mood ([1-5])")
+
+@dp.message()
+async def handle_mood_buttons(message: types.Message):
+    text = message.text or ""
+    m = _MOOD_RE.match(text)
+    if m is None:
+        if text.startswith("Mood "):
+            await message.answer("נא לבחור מ‑1 עד 5.")
+        return
+    score = int(m.group(1))
+    # Append to local CSV for simplicity
+    log_dir = os.getenv("DATA_DIR", ".")
+    os.makedirs(log_dir, exist_ok=True)
+    path = os.path.join(log_dir, "mood_log.csv")
+    try:
+        max_bytes = int(os.getenv("MOOD_LOG_MAX_BYTES", "0"))
+    except Exception:
+        max_bytes = 0
+    _append_mood_line(path, f"{datetime.now().isoformat()},{score}\n", max_bytes)
+    await message.answer(f"תודה! נשמר דירוג מצב רוח: {score}")
 
 async def send_scheduled(prefix_emoji: str):
     msg = await build_daily_message(prefix_emoji)
@@ -397,20 +592,23 @@ async def send_scheduled(prefix_emoji: str):
     except Exception as e:
         log.error(f"Failed to send scheduled message: {e}")
 
+_HHMM_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]?\d)$")
+
 def _parse_hhmm(s: str):
-    try:
-        parts = s.split(":")
-        if len(parts) != 2:
-            return None
-        h = int(parts[0])
-        m = int(parts[1])
-        if not (0 <= h <= 23 and 0 <= m <= 59):
-            return None
-        return h, m
-    except Exception:
+    m = _HHMM_RE.match(s)
+    if not m:
         return None
+    return int(m.group(1)), int(m.group(2))
 
 async def main():
+    global _http_session
+    # Small keep-alive pool: both upstreams (Open-Meteo + sauna server)
+    # reuse warm connections instead of a TCP/TLS handshake per call.
+    _http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+
     # Schedules based on MORNING_TIME / EVENING_TIME (HH:MM) and disable flags
     morning = _parse_hhmm(MORNING_TIME)
     evening = _parse_hhmm(EVENING_TIME)
@@ -427,7 +625,10 @@ async def main():
     scheduler.start()
     log.info("Scheduler started")
 
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await _http_session.close()
 
 if __name__ == "__main__":
     try:
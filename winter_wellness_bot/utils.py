@@ -1,57 +1,173 @@
-from datetime import datetime, timedelta
-from typing import List, Tuple, Dict, Any
+from datetime import datetime
+from typing import List, Tuple, Dict, Any, Sequence, Union
+
+import numpy as np
+
+# Optional accelerator: compile the detection loop to native code when
+# numba is available, otherwise fall back to the vectorized NumPy path.
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+# Samples are either the legacy list of (datetime, tempC) tuples or a
+# structure-of-arrays pair (epoch seconds float64, temps) as produced
+# by the fetchers for large windows. Integer temp arrays are tenths of
+# a degree; float arrays are plain °C.
+Samples = Union[Sequence[Tuple[datetime, float]], Tuple[np.ndarray, np.ndarray]]
+
+
+# Formatter per (has hours, has minutes): one dict lookup and one
+# f-string instead of a branch chain when formatting session batches.
+_H_M_FMT = {
+    (False, False): lambda h, m: "0ד׳",
+    (False, True): lambda h, m: f"{m}ד׳",
+    (True, False): lambda h, m: f"{h}ש׳",
+    (True, True): lambda h, m: f"{h}ש׳ {m}ד׳",
+}
 
 
 def human_duration(minutes: int) -> str:
     h, m = divmod(int(minutes), 60)
-    if h and m:
-        return f"{h}ש׳ {m}ד׳"
-    if h:
-        return f"{h}ש׳"
-    return f"{m}ד׳"
+    return _H_M_FMT[bool(h), bool(m)](h, m)
+
+
+_TENTHS_MIN = np.iinfo(np.int16).min
+_TENTHS_MAX = np.iinfo(np.int16).max
+
+
+def _to_tenths(temps: np.ndarray) -> np.ndarray:
+    # Tolerate bad sensor values instead of raising on the int16 cast:
+    # NaN and -inf read as arbitrarily cold, +inf as arbitrarily hot,
+    # and finite extremes clamp to the int16 range.
+    tenths = np.round(temps.astype(np.float64) * 10.0)
+    tenths = np.nan_to_num(tenths, nan=_TENTHS_MIN, posinf=_TENTHS_MAX, neginf=_TENTHS_MIN)
+    return np.clip(tenths, _TENTHS_MIN, _TENTHS_MAX).astype(np.int16)
+
+
+def _as_arrays(samples: Samples) -> Tuple[np.ndarray, np.ndarray]:
+    # Normalize samples to SoA arrays: epoch seconds + int16 tenths of a
+    # degree. The sensor reports one decimal, and integer compares and
+    # max-reductions vectorize wider while halving memory vs float32.
+    if isinstance(samples, tuple) and len(samples) == 2:
+        ts, temps = samples
+        ts = np.asarray(ts, dtype=np.float64)
+        temps = np.asarray(temps)
+        if np.issubdtype(temps.dtype, np.integer):
+            temps = temps.astype(np.int16, copy=False)
+        else:
+            temps = _to_tenths(temps)
+        return ts, temps
+    n = len(samples)
+    ts = np.fromiter((t.timestamp() for t, _ in samples), dtype=np.float64, count=n)
+    temps = _to_tenths(np.fromiter((temp for _, temp in samples), dtype=np.float64, count=n))
+    return ts, temps
+
+
+def _infer_sessions_vec(ts, temps, threshold, min_dur_s, gap_s):
+    # Vectorized detection, used when the compiled kernel is unavailable.
+    hot = temps >= threshold
+    if not hot.any():
+        empty = np.empty(0, np.int64)
+        return empty, empty, np.empty(0, temps.dtype)
+
+    # A session only closes at a below-threshold sample that arrives more
+    # than gap_s after the previous sample; everything between two such
+    # breaks belongs to one segment.
+    brk = np.zeros(ts.size, dtype=bool)
+    brk[1:] = ~hot[1:] & (np.diff(ts) > gap_s)
+    seg = np.cumsum(brk)
+
+    # Within each segment the session spans the first to last hot sample.
+    hot_idx = np.flatnonzero(hot)
+    cuts = np.flatnonzero(np.diff(seg[hot_idx])) + 1
+    first = np.concatenate(([0], cuts))
+    last = np.concatenate((cuts, [hot_idx.size])) - 1
+    starts = hot_idx[first]
+    ends = hot_idx[last]
+    max_c = np.maximum.reduceat(temps[hot_idx], first)
+
+    keep = ts[ends] - ts[starts] >= min_dur_s
+    return starts[keep], ends[keep], max_c[keep]
+
+
+def _infer_sessions_core(ts, temps, threshold, min_dur_s, gap_s):
+    # Scalar state-machine over SoA arrays; compiled with @njit below.
+    n = ts.shape[0]
+    starts = np.empty(n, np.int64)
+    ends = np.empty(n, np.int64)
+    max_c = np.empty(n, temps.dtype)
+    count = 0
+    active = False
+    a_start = 0
+    a_end = 0
+    a_max = temps[0]
+    for i in range(n):
+        temp = temps[i]
+        if temp >= threshold:
+            if not active:
+                active = True
+                a_start = i
+                a_end = i
+                a_max = temp
+            else:
+                a_end = i
+                if temp > a_max:
+                    a_max = temp
+        elif active and i > 0 and ts[i] - ts[i - 1] > gap_s:
+            if ts[a_end] - ts[a_start] >= min_dur_s:
+                starts[count] = a_start
+                ends[count] = a_end
+                max_c[count] = a_max
+                count += 1
+            active = False
+    if active and ts[a_end] - ts[a_start] >= min_dur_s:
+        starts[count] = a_start
+        ends[count] = a_end
+        max_c[count] = a_max
+        count += 1
+    return starts[:count], ends[:count], max_c[:count]
+
+
+if njit is not None:
+    _infer_sessions_core = njit(cache=True)(_infer_sessions_core)
+else:
+    _infer_sessions_core = _infer_sessions_vec
 
 
 def infer_sessions(
-    samples: List[Tuple[datetime, float]],
+    samples: Samples,
     threshold_c: float = 45.0,
     min_duration_min: int = 10,
     gap_minutes: int = 8,
 ) -> List[Dict[str, Any]]:
     """
-    Detect sauna sessions from (datetime, tempC) samples.
+    Detect sauna sessions from temperature samples.
+    Accepts either a list of (datetime, tempC) tuples or a pair of
+    NumPy arrays (epoch seconds, tempC) sorted by time.
     - A session starts when temp >= threshold.
     - It continues as long as subsequent samples either stay >= threshold
       or the gap between samples is < gap_minutes.
     - A session ends when a gap >= gap_minutes occurs while below threshold.
     - Only sessions with duration >= min_duration_min are returned.
+    Temperatures are compared at tenth-of-a-degree resolution.
     Returns list of dicts: {start, end, max_c, minutes} sorted by time.
     """
-    sessions: List[Dict[str, Any]] = []
-    active: Dict[str, Any] | None = None
-    last_t: datetime | None = None
+    ts, temps = _as_arrays(samples)
+    if ts.size == 0:
+        return []
 
-    for t, temp in samples:
-        if temp >= threshold_c:
-            if active is None:
-                active = {"start": t, "end": t, "max_c": temp}
-            else:
-                active["end"] = t
-                active["max_c"] = max(active["max_c"], temp)
-        else:
-            if active:
-                if last_t and (t - last_t) > timedelta(minutes=gap_minutes):
-                    dur = (active["end"] - active["start"]).total_seconds() / 60.0
-                    if dur >= min_duration_min:
-                        active["minutes"] = int(dur)
-                        sessions.append(active)
-                    active = None
-        last_t = t
-
-    if active:
-        dur = (active["end"] - active["start"]).total_seconds() / 60.0
-        if dur >= min_duration_min:
-            active["minutes"] = int(dur)
-            sessions.append(active)
+    starts, ends, max_c = _infer_sessions_core(
+        ts, temps, np.int16(round(threshold_c * 10)), min_duration_min * 60.0, gap_minutes * 60.0
+    )
 
+    sessions: List[Dict[str, Any]] = []
+    for i in range(starts.size):
+        s, e = ts[starts[i]], ts[ends[i]]
+        sessions.append({
+            "start": datetime.fromtimestamp(s),
+            "end": datetime.fromtimestamp(e),
+            "max_c": float(max_c[i]) / 10.0,
+            "minutes": int((e - s) / 60.0),
+        })
     return sessions
-
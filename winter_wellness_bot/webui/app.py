@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import os
+import re
 import subprocess
 import pwd
 import grp
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple
 
 from flask import Flask, render_template, request, redirect, url_for, flash
@@ -26,15 +28,31 @@ app = Flask(__name__)
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "winter-wellness-webui")
 
 
+# Parsed .env keyed by mtime so repeat reads (every render and status
+# poll) cost an os.stat + dict copy instead of a dotenv parse.
+_env_cache: Tuple[int, Dict[str, str]] | None = None
+
+
 def read_env() -> Dict[str, str]:
-    if not os.path.exists(ENV_FILE):
+    global _env_cache
+    try:
+        st = os.stat(ENV_FILE)
+    except OSError:
         return {}
+    if _env_cache is not None and _env_cache[0] == st.st_mtime_ns:
+        return _env_cache[1].copy()
     try:
         data = dotenv_values(ENV_FILE)
         # dotenv_values returns OrderedDict with None for empty values; coerce to str
-        return {k: ("" if v is None else str(v)) for k, v in data.items()}
+        parsed = {k: ("" if v is None else str(v)) for k, v in data.items()}
     except Exception:
         return {}
+    _env_cache = (st.st_mtime_ns, parsed)
+    return parsed.copy()
+
+
+# Values containing spaces or special chars get quoted on write
+_NEEDS_QUOTE = re.compile(r'[ #"]')
 
 
 def write_env(values: Dict[str, str]) -> None:
@@ -58,28 +76,14 @@ def write_env(values: Dict[str, str]) -> None:
         "LOG_TO_FILE",
         "MOOD_LOG_MAX_BYTES",
     ]
+    # Preferred keys first, then any extras, in a single quoting pass
+    ordered = {k: values[k] for k in keys_preferred if k in values}
+    ordered.update((k, v) for k, v in values.items() if k not in ordered)
     lines = []
-    for k in keys_preferred:
-        if k in values:
-            v = values[k]
-            if v is None:
-                v = ""
-            # Basic escaping: wrap in quotes if contains spaces or special chars
-            if any(ch in v for ch in [' ', '#', '"']):
-                vv = '"' + v.replace('"', '\\"') + '"'
-            else:
-                vv = v
-            lines.append(f"{k}={vv}")
-    # Append any extra keys not in preferred list
-    for k, v in values.items():
-        if k in keys_preferred:
-            continue
+    for k, v in ordered.items():
         if v is None:
             v = ""
-        if any(ch in v for ch in [' ', '#', '"']):
-            vv = '"' + v.replace('"', '\\"') + '"'
-        else:
-            vv = v
+        vv = '"' + v.replace('"', '\\"') + '"' if _NEEDS_QUOTE.search(v) else v
         lines.append(f"{k}={vv}")
     tmp_path = ENV_FILE + ".tmp"
     os.makedirs(MANAGED_DIR, exist_ok=True)
@@ -87,6 +91,8 @@ def write_env(values: Dict[str, str]) -> None:
         f.write("\n".join(lines) + "\n")
     # Attempt atomic replace
     os.replace(tmp_path, ENV_FILE)
+    global _env_cache
+    _env_cache = None
     try:
         # Keep file reasonably private but group-writable for admin group
         os.chmod(ENV_FILE, 0o660)
@@ -94,9 +100,9 @@ def write_env(values: Dict[str, str]) -> None:
         pass
 
 
-def run_cmd(cmd: list) -> Tuple[int, str]:
+def run_cmd(cmd: list, timeout: int = 30) -> Tuple[int, str]:
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=timeout)
         return 0, out
     except subprocess.CalledProcessError as e:
         return e.returncode, e.output
@@ -110,16 +116,28 @@ def systemctl(action: str) -> Tuple[int, str]:
     return run_cmd(cmd)
 
 
+# The four status probes are independent; run them in parallel so the
+# page waits for the slowest fork+exec instead of the sum of all four.
+_STATUS_JOBS = {
+    "active": ["systemctl", "is-active", SERVICE_NAME],
+    "enabled": ["systemctl", "is-enabled", SERVICE_NAME],
+    "status": ["systemctl", "status", SERVICE_NAME, "--no-pager", "--lines", "15"],
+    "journal": ["journalctl", "-u", SERVICE_NAME, "-n", "200", "--no-pager", "--output", "short"],
+}
+
+
 def service_status() -> Dict[str, str]:
     st = {}
-    code, out = run_cmd(["systemctl", "is-active", SERVICE_NAME])
+    with ThreadPoolExecutor(max_workers=len(_STATUS_JOBS)) as ex:
+        futs = {k: ex.submit(run_cmd, cmd, 5) for k, cmd in _STATUS_JOBS.items()}
+        results = {k: f.result() for k, f in futs.items()}
+    code, out = results["active"]
     st["active"] = out.strip() if out else ("error" if code != 0 else "unknown")
-    code, out = run_cmd(["systemctl", "is-enabled", SERVICE_NAME])
+    code, out = results["enabled"]
     st["enabled"] = out.strip() if out else ("unknown")
-    code, out = run_cmd(["systemctl", "status", SERVICE_NAME, "--no-pager", "--lines", "15"])
-    st["status"] = out.strip()
+    st["status"] = results["status"][1].strip()
     # Try journalctl for recent logs
-    code, out = run_cmd(["journalctl", "-u", SERVICE_NAME, "-n", "200", "--no-pager", "--output", "short"])
+    code, out = results["journal"]
     if code == 0:
         st["journal"] = out
     else:
@@ -264,7 +282,37 @@ def main():
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8080"))
     debug = getenv_bool("FLASK_DEBUG", False)
-    app.run(host=host, port=port, debug=debug)
+    # Werkzeug's dev server handles one request at a time, which stacks
+    # badly with the subprocess-heavy status page; serve through gunicorn
+    # unless debugging or explicitly disabled (USE_GUNICORN=0).
+    if debug or not getenv_bool("USE_GUNICORN", True):
+        app.run(host=host, port=port, debug=debug)
+        return
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        app.run(host=host, port=port, debug=debug)
+        return
+
+    class WebUIApplication(BaseApplication):
+        def __init__(self, wsgi_app, options):
+            self.options = options
+            self.application = wsgi_app
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    WebUIApplication(app, {
+        "bind": f"{host}:{port}",
+        "workers": 2,
+        "threads": 4,
+        "worker_class": "gthread",
+    }).run()
 
 
 if __name__ == "__main__":